@@ -111,7 +111,64 @@ minow provides a dual-panel interface for managing S3-compatible object storage.
         if event.button.id == "close":
             self.dismiss()
 
-class CreateBucketScreen(ModalScreen):
+class ButtonDispatchScreen(ModalScreen):
+    """Modal screen that routes button presses through a per-class _HANDLERS table."""
+
+    # Button id -> handler method; any other button cancels
+    _HANDLERS: dict[str, str] = {}
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        getattr(self, self._HANDLERS.get(event.button.id, "_handle_cancel"))(event)
+
+    def _handle_cancel(self, event: Button.Pressed) -> None:
+        self.dismiss(None)
+
+
+class ExpiryScreen(ButtonDispatchScreen):
+    """Modal screen with an expiry input and minutes/hours/days unit buttons."""
+
+    _HANDLERS = {
+        "minutes": "_handle_time_unit",
+        "hours": "_handle_time_unit",
+        "days": "_handle_time_unit",
+        "generate": "_handle_generate",
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.time_unit = "minutes"  # Default time unit
+
+    def _handle_time_unit(self, event: Button.Pressed) -> None:
+        self.time_unit = event.button.id
+        # Update button variants to show selection
+        for button in self.query("Button"):
+            if button.id in ["minutes", "hours", "days"]:
+                button.variant = "primary" if button.id == self.time_unit else "default"
+
+    def _expiry_minutes(self) -> int:
+        """Read the expiry input and convert it to minutes using the selected unit."""
+        expiry_str = self.query_one("#expiry_input").value.strip()
+        # Default to 15 if empty or invalid input
+        expiry_value = int(expiry_str) if expiry_str.isdecimal() else 15
+
+        # Calculate expiry in minutes based on selected unit
+        if self.time_unit == "hours":
+            return expiry_value * 60
+        elif self.time_unit == "days":
+            return expiry_value * 60 * 24
+        else: # minutes
+            return expiry_value
+
+
+class CreateBucketScreen(ButtonDispatchScreen):
+    _HANDLERS = {
+        "enable_lock": "_handle_enable_lock",
+        "no_lock": "_handle_no_lock",
+        "governance": "_handle_governance",
+        "compliance": "_handle_compliance",
+        "create": "_handle_create",
+    }
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.object_lock_enabled = False
@@ -162,51 +219,50 @@ class CreateBucketScreen(ModalScreen):
             button.display = True
         self.query_one("#retention_mode_status").display = True
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "enable_lock":
-            self.object_lock_enabled = True
-            self.query_one("#lock_status").update("✓ Object Lock will be enabled")
-            self.show_retention_settings()
-            
-        elif event.button.id == "no_lock":
-            self.object_lock_enabled = False
-            self.query_one("#lock_status").update("○ Object Lock disabled")
-            self.hide_retention_settings()
-            self.default_retention_days = None
-            
-        elif event.button.id == "governance":
-            self.default_retention_mode = "GOVERNANCE"
-            self.query_one("#retention_mode_status").update("Mode: GOVERNANCE (can be overridden)")
-            
-        elif event.button.id == "compliance":
-            self.default_retention_mode = "COMPLIANCE"
-            self.query_one("#retention_mode_status").update("Mode: COMPLIANCE (cannot be overridden)")
+    def _handle_enable_lock(self, event: Button.Pressed) -> None:
+        self.object_lock_enabled = True
+        self.query_one("#lock_status").update("✓ Object Lock will be enabled")
+        self.show_retention_settings()
+
+    def _handle_no_lock(self, event: Button.Pressed) -> None:
+        self.object_lock_enabled = False
+        self.query_one("#lock_status").update("○ Object Lock disabled")
+        self.hide_retention_settings()
+        self.default_retention_days = None
+
+    def _handle_governance(self, event: Button.Pressed) -> None:
+        self.default_retention_mode = "GOVERNANCE"
+        self.query_one("#retention_mode_status").update("Mode: GOVERNANCE (can be overridden)")
+
+    def _handle_compliance(self, event: Button.Pressed) -> None:
+        self.default_retention_mode = "COMPLIANCE"
+        self.query_one("#retention_mode_status").update("Mode: COMPLIANCE (cannot be overridden)")
+
+    def _handle_create(self, event: Button.Pressed) -> None:
+        bucket_name = self.query_one("#bucket_name_input").value.strip()
+        if bucket_name:
+            # Get retention days if Object Lock is enabled
+            if self.object_lock_enabled:
+                retention_days_str = self.query_one("#retention_days_input").value.strip()
+                if retention_days_str:
+                    try:
+                        self.default_retention_days = int(retention_days_str)
+                    except ValueError:
+                        self.default_retention_days = None
             
-        elif event.button.id == "create":
-            bucket_name = self.query_one("#bucket_name_input").value.strip()
-            if bucket_name:
-                # Get retention days if Object Lock is enabled
-                if self.object_lock_enabled:
-                    retention_days_str = self.query_one("#retention_days_input").value.strip()
-                    if retention_days_str:
-                        try:
-                            self.default_retention_days = int(retention_days_str)
-                        except ValueError:
-                            self.default_retention_days = None
-                
-                result = {
-                    'name': bucket_name,
-                    'object_lock_enabled': self.object_lock_enabled,
-                    'default_retention_days': self.default_retention_days,
-                    'default_retention_mode': self.default_retention_mode
-                }
-                self.dismiss(result)
-            else:
-                self.dismiss(None)
+            result = {
+                'name': bucket_name,
+                'object_lock_enabled': self.object_lock_enabled,
+                'default_retention_days': self.default_retention_days,
+                'default_retention_mode': self.default_retention_mode
+            }
+            self.dismiss(result)
         else:
             self.dismiss(None)
 
-class UploadFileScreen(ModalScreen):
+class UploadFileScreen(ButtonDispatchScreen):
+    _HANDLERS = {"upload": "_handle_upload"}
+
     def __init__(self, initial_path: str = "", **kwargs):
         super().__init__(**kwargs)
         self.initial_path = initial_path
@@ -222,15 +278,14 @@ class UploadFileScreen(ModalScreen):
                 yield Button("Upload", variant="primary", id="upload")
                 yield Button("Cancel", id="cancel")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "upload":
-            file_path = self.query_one("#file_path_input").value
-            object_name = self.query_one("#object_name_input").value
-            self.dismiss((file_path, object_name))
-        else:
-            self.dismiss(None)
+    def _handle_upload(self, event: Button.Pressed) -> None:
+        file_path = self.query_one("#file_path_input").value
+        object_name = self.query_one("#object_name_input").value
+        self.dismiss((file_path, object_name))
+
+class DownloadFileScreen(ButtonDispatchScreen):
+    _HANDLERS = {"download": "_handle_download"}
 
-class DownloadFileScreen(ModalScreen):
     def compose(self) -> ComposeResult:
         with Vertical(classes="modal-container"):
             yield Static("Download File", classes="modal-title")
@@ -239,12 +294,9 @@ class DownloadFileScreen(ModalScreen):
                 yield Button("Download", variant="primary", id="download")
                 yield Button("Cancel", id="cancel")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "download":
-            value = self.query_one("#file_path_input").value
-            self.dismiss(value)
-        else:
-            self.dismiss(None)
+    def _handle_download(self, event: Button.Pressed) -> None:
+        value = self.query_one("#file_path_input").value
+        self.dismiss(value)
 
 class ConfirmDeleteScreen(ModalScreen):
     def __init__(self, item_to_delete: str, **kwargs):
@@ -261,11 +313,7 @@ class ConfirmDeleteScreen(ModalScreen):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         self.dismiss(event.button.id == "delete")
 
-class PresignURLScreen(ModalScreen):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.time_unit = "minutes"  # Default time unit
-
+class PresignURLScreen(ExpiryScreen):
     def compose(self) -> ComposeResult:
         with Vertical(classes="modal-container"):
             yield Static("Generate Presigned URL", classes="modal-title")
@@ -281,32 +329,8 @@ class PresignURLScreen(ModalScreen):
                 yield Button("Generate", variant="primary", id="generate")
                 yield Button("Cancel", id="cancel")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id in ["minutes", "hours", "days"]:
-            self.time_unit = event.button.id
-            # Update button variants to show selection
-            for button in self.query("Button"):
-                if button.id in ["minutes", "hours", "days"]:
-                    button.variant = "primary" if button.id == self.time_unit else "default"
-
-        elif event.button.id == "generate":
-            expiry_str = self.query_one("#expiry_input").value
-            try:
-                expiry_value = int(expiry_str) if expiry_str else 15
-                
-                # Calculate expiry in minutes based on selected unit
-                if self.time_unit == "hours":
-                    expiry_minutes = expiry_value * 60
-                elif self.time_unit == "days":
-                    expiry_minutes = expiry_value * 60 * 24
-                else: # minutes
-                    expiry_minutes = expiry_value
-                    
-                self.dismiss(expiry_minutes)
-            except ValueError:
-                self.dismiss(15)  # Default to 15 minutes if invalid input
-        else:
-            self.dismiss(None)
+    def _handle_generate(self, event: Button.Pressed) -> None:
+        self.dismiss(self._expiry_minutes())
 
 class ShowURLScreen(ModalScreen):
     def __init__(self, url: str, **kwargs):
@@ -330,11 +354,10 @@ class ShowURLScreen(ModalScreen):
         self.dismiss()
 
 
-class UploadPresignURLScreen(ModalScreen):
+class UploadPresignURLScreen(ExpiryScreen):
     def __init__(self, current_path=""):
         super().__init__()
         self.current_path = current_path
-        self.time_unit = "minutes"
 
     def compose(self) -> ComposeResult:
         with Vertical(classes="modal-container"):
@@ -365,47 +388,19 @@ class UploadPresignURLScreen(ModalScreen):
                 yield Button("Generate", variant="primary", id="generate")
                 yield Button("Cancel", id="cancel")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id in ["minutes", "hours", "days"]:
-            self.time_unit = event.button.id
-            # Update button variants to show selection
-            for button in self.query("Button"):
-                if button.id in ["minutes", "hours", "days"]:
-                    button.variant = "primary" if button.id == self.time_unit else "default"
-
-        elif event.button.id == "generate":
-            object_name = self.query_one("#object_name").value.strip()
-            content_type = self.query_one("#content_type").value.strip()
-            expiry_str = self.query_one("#expiry_input").value.strip()
-
-            if not object_name:
-                # Could add error display here
-                return
+    def _handle_generate(self, event: Button.Pressed) -> None:
+        object_name = self.query_one("#object_name").value.strip()
+        content_type = self.query_one("#content_type").value.strip()
 
-            try:
-                expiry_value = int(expiry_str) if expiry_str else 15
-                
-                # Calculate expiry in minutes based on selected unit
-                if self.time_unit == "hours":
-                    expiry_minutes = expiry_value * 60
-                elif self.time_unit == "days":
-                    expiry_minutes = expiry_value * 60 * 24
-                else: # minutes
-                    expiry_minutes = expiry_value
-
-                self.dismiss({
-                    "object_name": object_name,
-                    "content_type": content_type if content_type else None,
-                    "expiry_minutes": expiry_minutes
-                })
-            except ValueError:
-                self.dismiss({
-                    "object_name": object_name,
-                    "content_type": content_type if content_type else None,
-                    "expiry_minutes": 15  # Default to 15 minutes if invalid input
-                })
-        else:
-            self.dismiss(None)
+        if not object_name:
+            # Could add error display here
+            return
+
+        self.dismiss({
+            "object_name": object_name,
+            "content_type": content_type if content_type else None,
+            "expiry_minutes": self._expiry_minutes()
+        })
 
 
 class MetadataScreen(ModalScreen):
@@ -444,7 +439,9 @@ class MetadataScreen(ModalScreen):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         self.dismiss()
 
-class RenameObjectScreen(ModalScreen):
+class RenameObjectScreen(ButtonDispatchScreen):
+    _HANDLERS = {"rename": "_handle_rename"}
+
     def __init__(self, current_name: str, **kwargs):
         super().__init__(**kwargs)
         self.current_name = current_name
@@ -458,17 +455,16 @@ class RenameObjectScreen(ModalScreen):
                 yield Button("Rename", variant="primary", id="rename")
                 yield Button("Cancel", id="cancel")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "rename":
-            new_name = self.query_one("#new_name_input").value.strip()
-            if new_name and new_name != self.current_name:
-                self.dismiss(new_name)
-            else:
-                self.dismiss(None)
+    def _handle_rename(self, event: Button.Pressed) -> None:
+        new_name = self.query_one("#new_name_input").value.strip()
+        if new_name and new_name != self.current_name:
+            self.dismiss(new_name)
         else:
             self.dismiss(None)
 
-class CreateDirectoryScreen(ModalScreen):
+class CreateDirectoryScreen(ButtonDispatchScreen):
+    _HANDLERS = {"create": "_handle_create"}
+
     def __init__(self, initial_path: str = "", **kwargs):
         super().__init__(**kwargs)
         self.initial_path = initial_path
@@ -484,16 +480,13 @@ class CreateDirectoryScreen(ModalScreen):
                 yield Button("Create", variant="primary", id="create")
                 yield Button("Cancel", id="cancel")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "create":
-            directory_name = self.query_one("#directory_name_input").value.strip()
-            if directory_name:
-                # Ensure it ends with / for S3 directory convention
-                if not directory_name.endswith('/'):
-                    directory_name += '/'
-                self.dismiss(directory_name)
-            else:
-                self.dismiss(None)
+    def _handle_create(self, event: Button.Pressed) -> None:
+        directory_name = self.query_one("#directory_name_input").value.strip()
+        if directory_name:
+            # Ensure it ends with / for S3 directory convention
+            if not directory_name.endswith('/'):
+                directory_name += '/'
+            self.dismiss(directory_name)
         else:
             self.dismiss(None)
 
@@ -956,8 +949,9 @@ class MinioTUI(App):
             buckets = self.minio_client.list_buckets()
             bucket_data = []
             for bucket_name in buckets:
-                objects = self.minio_client.list_objects(bucket_name)
-                bucket_data.append((bucket_name, len(objects)))
+                # Count as keys stream in rather than holding every key in memory
+                count = sum(1 for _ in self.minio_client.iter_objects(bucket_name))
+                bucket_data.append((bucket_name, count))
             self.call_from_thread(self.update_bucket_table, bucket_data)
         except Exception as e:
             # Post error to the correct status bar
@@ -1472,7 +1466,8 @@ class MinioTUI(App):
         self.run_worker(fetch_content, thread=True)
         self.set_status("Loading file preview...")
 
-    def is_text_file(self, filename: str) -> bool:
+    @staticmethod
+    def is_text_file(filename: str) -> bool:
         """Check if a file is likely to be a text file based on its extension."""
         if not filename:
             return False
@@ -60,23 +60,30 @@ class MinioClient:
         """Deletes a bucket."""
         self.client.delete_bucket(Bucket=bucket_name)
 
+    def iter_objects(self, bucket_name, prefix=""):
+        """Yields object keys in a bucket, following ListObjectsV2 pagination."""
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield obj["Key"]
+
     def list_objects(self, bucket_name):
         """Lists all objects in a bucket."""
-        response = self.client.list_objects_v2(Bucket=bucket_name)
-        return [obj["Key"] for obj in response.get("Contents", [])]
+        return list(self.iter_objects(bucket_name))
 
     def list_objects_with_metadata(self, bucket_name):
-        """Lists all objects in a bucket with metadata."""
-        response = self.client.list_objects_v2(Bucket=bucket_name)
+        """Lists all objects in a bucket with metadata, following ListObjectsV2 pagination."""
+        paginator = self.client.get_paginator("list_objects_v2")
         objects = []
-        for obj in response.get("Contents", []):
-            objects.append({
-                'key': obj["Key"],
-                'size': obj["Size"],
-                'last_modified': obj["LastModified"],
-                'etag': obj.get("ETag", "").strip('"'),
-                'storage_class': obj.get("StorageClass", "STANDARD")
-            })
+        for page in paginator.paginate(Bucket=bucket_name):
+            for obj in page.get("Contents", []):
+                objects.append({
+                    'key': obj["Key"],
+                    'size': obj["Size"],
+                    'last_modified': obj["LastModified"],
+                    'etag': obj.get("ETag", "").strip('"'),
+                    'storage_class': obj.get("StorageClass", "STANDARD")
+                })
         return objects
 
     def get_object_metadata(self, bucket_name, object_key):
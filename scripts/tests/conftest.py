@@ -0,0 +1,70 @@
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add the 'scripts' directory to the Python path to allow importing 'minio_tui'
+_SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+
+def _clear_minio_env(monkeypatch):
+    """Remove any MINIO_TUI_* variables so they cannot leak into the config under test."""
+    for key in list(os.environ):
+        if key.startswith("MINIO_TUI_"):
+            monkeypatch.delenv(key)
+
+
+@pytest.fixture(autouse=True)
+def _clean_env(monkeypatch):
+    """Run every test without MINIO_TUI_* variables from the caller's environment."""
+    _clear_minio_env(monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def _clean_module_env():
+    """The same cleanup for module-scoped fixtures, which run before _clean_env."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _clear_minio_env(monkeypatch)
+        yield
+
+
+@pytest.fixture(scope="module")
+def _shared_app():
+    """One TUI app per requesting module; building a Textual App is too costly to repeat per test."""
+    # Imported here so client- and config-only runs never load Textual
+    from minio_tui.app import MinioTUI
+    from minio_tui.minio_client import MinioClient
+
+    return MinioTUI(minio_client=MagicMock(spec=MinioClient))
+
+
+@pytest.fixture
+def app(_shared_app):
+    """The shared TUI app, restored to its just-constructed state."""
+    _shared_app.minio_client.reset_mock(return_value=True, side_effect=True)
+    _shared_app.current_bucket = None
+    _shared_app.all_objects = []
+    _shared_app.search_filter = ""
+    return _shared_app
+
+
+@pytest.fixture
+def mock_minio_client(app):
+    """The spec'd MinIO client mock the shared app is wired to."""
+    return app.minio_client
+
+
+@pytest.fixture(scope="session")
+def canonical_toml(tmp_path_factory):
+    """Path to a [minio] TOML config written once per session; tests must only read it."""
+    path = tmp_path_factory.mktemp("cfg") / "config.toml"
+    path.write_text(
+        '[minio]\n'
+        'endpoint_url = "http://localhost:9000"\n'
+        'access_key = "toml_access_key"\n'
+        'secret_key = "toml_secret_key"\n'
+    )
+    return str(path)
@@ -1,13 +1,14 @@
 import unittest
+import socket
 import time
-import os
 import tempfile
 from pathlib import Path
 import sys
 
 # Add the 'scripts' directory to the Python path to allow importing 'minio_tui'
-scripts_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(scripts_dir))
+scripts_dir = str(Path(__file__).parent.parent.parent)
+if scripts_dir not in sys.path:
+    sys.path.insert(0, scripts_dir)
 
 from minio_tui.simple_config import Config
 from minio_tui.minio_client import MinioClient
@@ -19,14 +20,29 @@ class MinIOIntegrationTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up the test environment with real MinIO connection."""
+        # Probe the port first so a missing server skips immediately instead
+        # of waiting out boto3's connect timeouts and retries
+        try:
+            with socket.create_connection(("localhost", 9000), timeout=0.1):
+                pass
+        except OSError as e:
+            raise unittest.SkipTest(f"MinIO test server not reachable: {e}")
+
         try:
             # Create MinIO client directly with test configuration
             import boto3
+            from botocore.config import Config as BotoConfig
             cls.boto3_client = boto3.client(
                 "s3",
                 endpoint_url="http://localhost:9000",
                 aws_access_key_id="testuser",
                 aws_secret_access_key="testpass123",
+                # Fail fast if the server is up but unhealthy
+                config=BotoConfig(
+                    connect_timeout=1,
+                    read_timeout=5,
+                    retries={"max_attempts": 1},
+                ),
             )
             cls.minio_client = MinioClient(client=cls.boto3_client)
             
@@ -41,8 +57,17 @@ class MinIOIntegrationTest(unittest.TestCase):
         """Set up individual test."""
         # Create a unique test bucket name
         self.test_bucket_name = f"test-bucket-{int(time.time())}"
-        self.test_objects_created = []
-        self.test_buckets_created = []
+        self.test_objects_created = set()
+        self.test_buckets_created = set()
+        # Scratch directory for local files, removed in one go after the test
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+    
+    def write_temp_file(self, name, content):
+        """Write text content to a file in the test's scratch directory."""
+        path = Path(self.temp_dir.name) / name
+        path.write_text(content)
+        return str(path)
     
     def tearDown(self):
         """Clean up after each test."""
@@ -68,7 +93,7 @@ class TestMinIOClientIntegration(MinIOIntegrationTest):
         """Test complete bucket lifecycle: create, list, delete."""
         # Create bucket
         self.minio_client.create_bucket(self.test_bucket_name)
-        self.test_buckets_created.append(self.test_bucket_name)
+        self.test_buckets_created.add(self.test_bucket_name)
         
         # Verify bucket exists
         buckets = self.minio_client.list_buckets()
@@ -86,67 +111,52 @@ class TestMinIOClientIntegration(MinIOIntegrationTest):
         """Test complete object lifecycle: upload, list, download, delete."""
         # Create test bucket
         self.minio_client.create_bucket(self.test_bucket_name)
-        self.test_buckets_created.append(self.test_bucket_name)
+        self.test_buckets_created.add(self.test_bucket_name)
         
         # Create test file
         test_content = "Hello, MinIO Integration Test!"
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            f.write(test_content)
-            test_file_path = f.name
+        test_file_path = self.write_temp_file("upload.txt", test_content)
         
-        try:
-            object_name = "test-object.txt"
-            
-            # Upload file
-            self.minio_client.upload_file(self.test_bucket_name, object_name, test_file_path)
-            self.test_objects_created.append((self.test_bucket_name, object_name))
-            
-            # List objects
-            objects = self.minio_client.list_objects(self.test_bucket_name)
-            self.assertIn(object_name, objects)
-            
-            # Download file
-            with tempfile.NamedTemporaryFile(delete=False) as f:
-                download_path = f.name
-            
-            self.minio_client.download_file(self.test_bucket_name, object_name, download_path)
-            
-            # Verify content
-            with open(download_path, 'r') as f:
-                downloaded_content = f.read()
-            self.assertEqual(downloaded_content, test_content)
-            
-            # Get metadata
-            metadata = self.minio_client.get_object_metadata(self.test_bucket_name, object_name)
-            self.assertGreater(metadata['size'], 0)
-            self.assertIsNotNone(metadata['last_modified'])
-            
-            # Delete object
-            self.minio_client.delete_object(self.test_bucket_name, object_name)
-            self.test_objects_created.remove((self.test_bucket_name, object_name))
-            
-            # Verify object is gone
-            objects = self.minio_client.list_objects(self.test_bucket_name)
-            self.assertNotIn(object_name, objects)
-            
-        finally:
-            # Clean up temp files
-            try:
-                os.unlink(test_file_path)
-                os.unlink(download_path)
-            except:
-                pass
+        object_name = "test-object.txt"
+        
+        # Upload file
+        self.minio_client.upload_file(self.test_bucket_name, object_name, test_file_path)
+        self.test_objects_created.add((self.test_bucket_name, object_name))
+        
+        # List objects
+        objects = self.minio_client.list_objects(self.test_bucket_name)
+        self.assertIn(object_name, objects)
+        
+        # Download file
+        download_path = str(Path(self.temp_dir.name) / "download.txt")
+        self.minio_client.download_file(self.test_bucket_name, object_name, download_path)
+        
+        # Verify content
+        self.assertEqual(Path(download_path).read_text(), test_content)
+        
+        # Get metadata
+        metadata = self.minio_client.get_object_metadata(self.test_bucket_name, object_name)
+        self.assertGreater(metadata['size'], 0)
+        self.assertIsNotNone(metadata['last_modified'])
+        
+        # Delete object
+        self.minio_client.delete_object(self.test_bucket_name, object_name)
+        self.test_objects_created.remove((self.test_bucket_name, object_name))
+        
+        # Verify object is gone
+        objects = self.minio_client.list_objects(self.test_bucket_name)
+        self.assertNotIn(object_name, objects)
     
     def test_directory_operations(self):
         """Test directory creation and deletion."""
         # Create test bucket
         self.minio_client.create_bucket(self.test_bucket_name)
-        self.test_buckets_created.append(self.test_bucket_name)
+        self.test_buckets_created.add(self.test_bucket_name)
         
         # Create directory
         directory_name = "test-folder/"
         self.minio_client.create_directory(self.test_bucket_name, directory_name)
-        self.test_objects_created.append((self.test_bucket_name, directory_name))
+        self.test_objects_created.add((self.test_bucket_name, directory_name))
         
         # Verify directory exists
         objects = self.minio_client.list_objects(self.test_bucket_name)
@@ -164,43 +174,34 @@ class TestMinIOClientIntegration(MinIOIntegrationTest):
         """Test presigned URL generation."""
         # Create test bucket
         self.minio_client.create_bucket(self.test_bucket_name)
-        self.test_buckets_created.append(self.test_bucket_name)
+        self.test_buckets_created.add(self.test_bucket_name)
         
         # Create test object
         test_content = "Test content for presigned URL"
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            f.write(test_content)
-            test_file_path = f.name
+        test_file_path = self.write_temp_file("presigned.txt", test_content)
         
-        try:
-            object_name = "test-presigned.txt"
-            self.minio_client.upload_file(self.test_bucket_name, object_name, test_file_path)
-            self.test_objects_created.append((self.test_bucket_name, object_name))
-            
-            # Generate download presigned URL
-            download_url = self.minio_client.generate_presigned_url(
-                self.test_bucket_name, object_name, expires_in=3600
-            )
-            self.assertIsInstance(download_url, str)
-            self.assertIn("localhost:9000", download_url)
-            self.assertIn(self.test_bucket_name, download_url)
-            self.assertIn(object_name, download_url)
-            
-            # Generate upload presigned URL
-            upload_object_name = "test-upload-presigned.txt"
-            upload_url = self.minio_client.generate_upload_presigned_url(
-                self.test_bucket_name, upload_object_name, expires_in=3600
-            )
-            self.assertIsInstance(upload_url, str)
-            self.assertIn("localhost:9000", upload_url)
-            self.assertIn(self.test_bucket_name, upload_url)
-            self.assertIn(upload_object_name, upload_url)
-            
-        finally:
-            try:
-                os.unlink(test_file_path)
-            except:
-                pass
+        object_name = "test-presigned.txt"
+        self.minio_client.upload_file(self.test_bucket_name, object_name, test_file_path)
+        self.test_objects_created.add((self.test_bucket_name, object_name))
+        
+        # Generate download presigned URL
+        download_url = self.minio_client.generate_presigned_url(
+            self.test_bucket_name, object_name, expires_in=3600
+        )
+        self.assertIsInstance(download_url, str)
+        self.assertIn("localhost:9000", download_url)
+        self.assertIn(self.test_bucket_name, download_url)
+        self.assertIn(object_name, download_url)
+        
+        # Generate upload presigned URL
+        upload_object_name = "test-upload-presigned.txt"
+        upload_url = self.minio_client.generate_upload_presigned_url(
+            self.test_bucket_name, upload_object_name, expires_in=3600
+        )
+        self.assertIsInstance(upload_url, str)
+        self.assertIn("localhost:9000", upload_url)
+        self.assertIn(self.test_bucket_name, upload_url)
+        self.assertIn(upload_object_name, upload_url)
 
 
 if __name__ == '__main__':
@@ -1,214 +1,215 @@
-import unittest
-from unittest.mock import MagicMock, patch, call
-import sys
-from pathlib import Path
-
-# Add the 'scripts' directory to the Python path to allow importing 'minio_tui'
-scripts_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(scripts_dir))
+import pytest
+from unittest.mock import MagicMock, call
 
 from minio_tui.app import MinioTUI
-from minio_tui.minio_client import MinioClient
-
-
-class TestMinioTUIActions(unittest.TestCase):
-
-    def setUp(self):
-        """Set up a mock MinIO client and TUI app for testing."""
-        self.mock_minio_client = MagicMock(spec=MinioClient)
-        self.app = MinioTUI(minio_client=self.mock_minio_client)
-
-    def test_action_create_bucket_success(self):
-        """Test successful bucket creation."""
-        with patch.object(self.app, 'push_screen') as mock_push_screen:
-            # Mock the screen callback
-            def mock_callback(bucket_name):
-                if bucket_name == "new-bucket":
-                    # Simulate successful bucket creation
-                    self.mock_minio_client.create_bucket(bucket_name)
-                    
-            # Call the action
-            self.app.action_create_bucket()
-            
-            # Verify that push_screen was called with the CreateBucketScreen
-            self.assertEqual(mock_push_screen.call_count, 1)
-            screen_class = mock_push_screen.call_args[0][0].__class__.__name__
-            self.assertEqual(screen_class, "CreateBucketScreen")
-
-    def test_action_delete_logic(self):
-        """Test delete action logic without UI dependencies."""
-        # Test that method exists and is callable
-        self.assertTrue(callable(self.app.action_delete_item))
-        
-        # We can't easily test the full delete flow without initializing 
-        # the Textual app, but we can test the MinIO client integration
-        # through the load methods which are tested separately
-
-    def test_action_upload_file_no_bucket(self):
-        """Test upload file action when no bucket is selected."""
-        self.app.current_bucket = None
-        
-        with patch.object(self.app, 'set_status') as mock_status:
-            self.app.action_upload_file()
-            mock_status.assert_called_once_with("Select a bucket before uploading.")
-
-    def test_action_upload_file_with_bucket(self):
-        """Test upload file action with bucket selected."""
-        self.app.current_bucket = "test-bucket"
-        
-        with patch.object(self.app, 'push_screen') as mock_push_screen:
-            self.app.action_upload_file()
-            
-            # Verify upload screen was shown
-            self.assertEqual(mock_push_screen.call_count, 1)
-            screen_class = mock_push_screen.call_args[0][0].__class__.__name__
-            self.assertEqual(screen_class, "UploadFileScreen")
-
-    def test_action_methods_exist(self):
-        """Test that all action methods exist and are callable."""
-        # Test that all action methods exist
-        self.assertTrue(callable(self.app.action_download_file))
-        self.assertTrue(callable(self.app.action_presign_url))
-        
-        # These methods require UI context to test properly, but we can
-        # verify they exist and test the underlying MinIO operations separately
-
-    def test_load_buckets_and_counts_success(self):
-        """Test successful loading of buckets and counts."""
-        # Mock the MinIO client responses
-        self.mock_minio_client.list_buckets.return_value = ["bucket1", "bucket2"]
-        self.mock_minio_client.list_objects.side_effect = [
-            ["obj1", "obj2", "obj3"],  # bucket1 has 3 objects
-            ["obj4", "obj5"]           # bucket2 has 2 objects
-        ]
-        
-        with patch.object(self.app, 'call_from_thread') as mock_call_from_thread:
-            # Call the worker method directly
-            self.app.load_buckets_and_counts()
-            
-            # Verify MinIO client calls
-            self.mock_minio_client.list_buckets.assert_called_once()
-            self.assertEqual(self.mock_minio_client.list_objects.call_count, 2)
-            
-            # Verify call_from_thread was called with bucket data
-            mock_call_from_thread.assert_called_once()
-            call_args = mock_call_from_thread.call_args
-            self.assertEqual(call_args[0][0].__name__, "update_bucket_table")
-            # Check the bucket data structure
-            bucket_data = call_args[0][1]
-            self.assertEqual(bucket_data, [("bucket1", 3), ("bucket2", 2)])
-
-    def test_load_buckets_and_counts_error(self):
-        """Test error handling in bucket loading."""
-        # Mock the MinIO client to raise an exception
-        self.mock_minio_client.list_buckets.side_effect = Exception("Connection error")
-        
-        # Mock the query_one method to avoid UI dependencies  
-        with patch.object(self.app, 'call_from_thread') as mock_call_from_thread:
-            with patch.object(self.app, 'query_one') as mock_query_one:
-                mock_status_widget = MagicMock()
-                mock_query_one.return_value = mock_status_widget
-                
-                # Call the worker method
-                self.app.load_buckets_and_counts()
-                
-                # Verify error was handled
-                mock_call_from_thread.assert_called_once()
-                # The call should be to update the status with an error message
-                call_args = mock_call_from_thread.call_args[0]
-                self.assertIn("Error:", str(call_args[1]))
-
-    def test_load_objects_success(self):
-        """Test successful loading of objects for a bucket."""
-        bucket_name = "test-bucket"
-        objects = ["file1.txt", "folder/file2.txt"]
-        
-        self.mock_minio_client.list_objects.return_value = objects
-        
-        with patch.object(self.app, 'call_from_thread') as mock_call_from_thread:
-            # Call the worker method
-            self.app.load_objects(bucket_name)
-            
-            # Verify MinIO client call
-            self.mock_minio_client.list_objects.assert_called_once_with(bucket_name)
-            
-            # Verify call_from_thread was called with objects
-            mock_call_from_thread.assert_called_once()
-            call_args = mock_call_from_thread.call_args
-            self.assertEqual(call_args[0][0].__name__, "store_and_update_objects")
-            self.assertEqual(call_args[0][1], objects)
-
-    def test_load_objects_error(self):
-        """Test error handling in object loading."""
-        bucket_name = "test-bucket"
-        
-        # Mock the MinIO client to raise an exception
-        self.mock_minio_client.list_objects.side_effect = Exception("Access denied")
-        
-        with patch.object(self.app, 'call_from_thread') as mock_call_from_thread:
-            # Call the worker method
-            self.app.load_objects(bucket_name)
-            
-            # Verify error was handled
-            mock_call_from_thread.assert_called_once()
-            call_args = mock_call_from_thread.call_args
-            self.assertEqual(call_args[0][0].__name__, "set_status")
-            self.assertIn("Error:", call_args[0][1])
-
-    def test_search_filter_functionality(self):
-        """Test that search filtering works correctly."""
-        # Setup initial objects
-        objects = ["file1.txt", "folder/file2.txt", "documents/report.pdf", "images/photo.jpg"]
-        self.app.all_objects = objects
-        self.app.current_bucket = "test-bucket"
-        
-        # Mock the tree and status widgets
-        mock_tree = MagicMock()
-        mock_status = MagicMock()
-        
-        with patch.object(self.app, 'query_one') as mock_query_one:
-            mock_query_one.side_effect = lambda selector: {
-                "#objects_tree": mock_tree,
-                "#object_status": mock_status
-            }[selector]
-            
-            # Test filtering for "file"
-            self.app.search_filter = "file"
-            self.app.update_object_tree(objects)
-            
-            # Verify status shows filtered count
-            mock_status.update.assert_called_with("2/4 objects (filtered)")
-            
-            # Test no filter
-            self.app.search_filter = ""
-            self.app.update_object_tree(objects)
-            
-            # Verify status shows all objects
-            mock_status.update.assert_called_with("4 objects found.")
-
-    def test_search_input_changed(self):
-        """Test that search input changes trigger filtering."""
-        # Mock input event
-        mock_input = MagicMock()
-        mock_input.id = "search_input"
-        mock_input.value = "test"
-        
-        # Setup objects
-        self.app.all_objects = ["test1.txt", "file.txt", "test2.jpg"]
-        self.app.current_bucket = "bucket"
-        
-        with patch.object(self.app, 'update_object_tree') as mock_update:
-            # Create mock event
-            from textual.widgets import Input
-            event = Input.Changed(mock_input, mock_input.value)
-            
-            # Call the handler
-            self.app.on_input_changed(event)
-            
-            # Verify filter was set and tree updated
-            self.assertEqual(self.app.search_filter, "test")
-            mock_update.assert_called_once_with(self.app.all_objects)
 
 
-if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+@pytest.fixture
+def mock_call_from_thread(app, monkeypatch):
+    """Stand in for call_from_thread so worker methods can be called directly."""
+    mock = MagicMock()
+    monkeypatch.setattr(app, 'call_from_thread', mock)
+    return mock
+
+
+def test_action_create_bucket_success(app, mock_minio_client, monkeypatch):
+    """Test successful bucket creation."""
+    mock_push_screen = MagicMock()
+    monkeypatch.setattr(app, 'push_screen', mock_push_screen)
+
+    # Mock the screen callback
+    def mock_callback(bucket_name):
+        if bucket_name == "new-bucket":
+            # Simulate successful bucket creation
+            mock_minio_client.create_bucket(bucket_name)
+            
+    # Call the action
+    app.action_create_bucket()
+    
+    # Verify that push_screen was called with the CreateBucketScreen
+    assert mock_push_screen.call_count == 1
+    screen_class = mock_push_screen.call_args[0][0].__class__.__name__
+    assert screen_class == "CreateBucketScreen"
+
+
+def test_action_delete_logic():
+    """Test delete action logic without UI dependencies."""
+    # Test that method exists and is callable
+    assert callable(MinioTUI.action_delete_item)
+    
+    # We can't easily test the full delete flow without initializing 
+    # the Textual app, but we can test the MinIO client integration
+    # through the load methods which are tested separately
+
+
+def test_action_upload_file_no_bucket(app, monkeypatch):
+    """Test upload file action when no bucket is selected."""
+    app.current_bucket = None
+    
+    mock_status = MagicMock()
+    monkeypatch.setattr(app, 'set_status', mock_status)
+
+    app.action_upload_file()
+    mock_status.assert_called_once_with("Select a bucket before uploading.")
+
+
+def test_action_upload_file_with_bucket(app, monkeypatch):
+    """Test upload file action with bucket selected."""
+    app.current_bucket = "test-bucket"
+    
+    mock_push_screen = MagicMock()
+    monkeypatch.setattr(app, 'push_screen', mock_push_screen)
+
+    app.action_upload_file()
+    
+    # Verify upload screen was shown
+    assert mock_push_screen.call_count == 1
+    screen_class = mock_push_screen.call_args[0][0].__class__.__name__
+    assert screen_class == "UploadFileScreen"
+
+
+def test_action_methods_exist():
+    """Test that all action methods exist and are callable."""
+    # Test that all action methods exist
+    assert callable(MinioTUI.action_download_file)
+    assert callable(MinioTUI.action_presign_url)
+    
+    # These methods require UI context to test properly, but we can
+    # verify they exist and test the underlying MinIO operations separately
+
+
+def test_load_buckets_and_counts_success(app, mock_minio_client, mock_call_from_thread):
+    """Test successful loading of buckets and counts."""
+    # Mock the MinIO client responses
+    mock_minio_client.list_buckets.return_value = ["bucket1", "bucket2"]
+    mock_minio_client.iter_objects.side_effect = [
+        iter(["obj1", "obj2", "obj3"]),  # bucket1 has 3 objects
+        iter(["obj4", "obj5"])           # bucket2 has 2 objects
+    ]
+    
+    # Call the worker method directly
+    app.load_buckets_and_counts()
+    
+    # Verify MinIO client calls
+    mock_minio_client.list_buckets.assert_called_once()
+    assert mock_minio_client.iter_objects.call_args_list == [call("bucket1"), call("bucket2")]
+    
+    # Verify call_from_thread was called with bucket data
+    mock_call_from_thread.assert_called_once()
+    call_args = mock_call_from_thread.call_args
+    assert call_args[0][0].__name__ == "update_bucket_table"
+    # Check the bucket data structure
+    bucket_data = call_args[0][1]
+    assert bucket_data == [("bucket1", 3), ("bucket2", 2)]
+
+
+def test_load_buckets_and_counts_error(app, mock_minio_client, mock_call_from_thread, monkeypatch):
+    """Test error handling in bucket loading."""
+    # Mock the MinIO client to raise an exception
+    mock_minio_client.list_buckets.side_effect = Exception("Connection error")
+    
+    # Mock the query_one method to avoid UI dependencies  
+    mock_status_widget = MagicMock()
+    monkeypatch.setattr(app, 'query_one', MagicMock(return_value=mock_status_widget))
+    
+    # Call the worker method
+    app.load_buckets_and_counts()
+    
+    # Verify error was handled
+    mock_call_from_thread.assert_called_once()
+    # The call should be to update the status with an error message
+    callback, message = mock_call_from_thread.call_args[0]
+    assert callback is mock_status_widget.update
+    assert message.startswith("Error:")
+
+
+@pytest.mark.parametrize(
+    "list_objects, expected_fn, expected_arg",
+    [
+        pytest.param(
+            {"return_value": ["file1.txt", "folder/file2.txt"]},
+            "store_and_update_objects",
+            ["file1.txt", "folder/file2.txt"],
+            id="success",
+        ),
+        pytest.param(
+            {"side_effect": Exception("Access denied")},
+            "set_status",
+            "Error: Access denied",
+            id="error",
+        ),
+    ],
+)
+def test_load_objects(app, mock_minio_client, mock_call_from_thread, list_objects, expected_fn, expected_arg):
+    """Test that loading a bucket's objects hands the result, or the error, back to the UI thread."""
+    bucket_name = "test-bucket"
+    mock_minio_client.list_objects.configure_mock(**list_objects)
+
+    # Call the worker method
+    app.load_objects(bucket_name)
+
+    # Verify MinIO client call
+    mock_minio_client.list_objects.assert_called_once_with(bucket_name)
+
+    # Verify call_from_thread was called once with the expected callback and argument
+    mock_call_from_thread.assert_called_once()
+    callback, arg = mock_call_from_thread.call_args[0]
+    assert callback.__name__ == expected_fn
+    assert arg == expected_arg
+
+
+def test_search_filter_functionality(app, monkeypatch):
+    """Test that search filtering works correctly."""
+    # Setup initial objects
+    objects = ["file1.txt", "folder/file2.txt", "documents/report.pdf", "images/photo.jpg"]
+    app.all_objects = objects
+    app.current_bucket = "test-bucket"
+    
+    # Mock the tree and status widgets
+    mock_tree = MagicMock()
+    mock_status = MagicMock()
+    
+    monkeypatch.setattr(app, 'query_one', lambda selector: {
+        "#objects_tree": mock_tree,
+        "#object_status": mock_status
+    }[selector])
+    
+    # Test filtering for "file"
+    app.search_filter = "file"
+    app.update_object_tree(objects)
+    
+    # Verify status shows filtered count
+    mock_status.update.assert_called_with("2/4 objects (filtered)")
+    
+    # Test no filter
+    app.search_filter = ""
+    app.update_object_tree(objects)
+    
+    # Verify status shows all objects
+    mock_status.update.assert_called_with("4 objects found.")
+
+
+def test_search_input_changed(app, monkeypatch):
+    """Test that search input changes trigger filtering."""
+    # Mock input event
+    mock_input = MagicMock()
+    mock_input.id = "search_input"
+    mock_input.value = "test"
+    
+    # Setup objects
+    app.all_objects = ["test1.txt", "file.txt", "test2.jpg"]
+    app.current_bucket = "bucket"
+    
+    mock_update = MagicMock()
+    monkeypatch.setattr(app, 'update_object_tree', mock_update)
+
+    # Create mock event
+    from textual.widgets import Input
+    event = Input.Changed(mock_input, mock_input.value)
+    
+    # Call the handler
+    app.on_input_changed(event)
+    
+    # Verify filter was set and tree updated
+    assert app.search_filter == "test"
+    mock_update.assert_called_once_with(app.all_objects)
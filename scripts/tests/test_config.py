@@ -1,6 +1,6 @@
-import os
-import unittest
 from pathlib import Path
+
+import pytest
 from dynaconf import Dynaconf
 
 # Define the path to the test configuration files
@@ -8,50 +8,43 @@ TESTS_DIR = Path(__file__).parent
 TEST_CONFIG_TOML = TESTS_DIR / "config.toml"
 TEST_DOTENV = TESTS_DIR / ".env"
 
-class TestConfig(unittest.TestCase):
-
-    def setUp(self):
-        """Set up a fresh Dynaconf instance for each test."""
-        # Clean up environment variables before each test
-        for key in list(os.environ.keys()):
-            if key.startswith("MINIO_TUI_"):
-                del os.environ[key]
-
-        self.settings = Dynaconf(
-            envvar_prefix="MINIO_TUI",
-            settings_files=[str(TEST_CONFIG_TOML)],
-            load_dotenv=True,
-            dotenv_path=str(TEST_DOTENV),
-        )
-
-    def test_load_from_toml(self):
-        """Tests that configuration is loaded from the TOML file."""
-        default_section = self.settings.get("DEFAULT")
-        self.assertEqual(default_section["minio"]["endpoint_url"], "http://localhost:9000")
-        self.assertEqual(default_section["minio"]["access_key"], "test_access_key")
-
-    def test_load_from_dotenv(self):
-        """Tests that configuration is loaded from the .env file."""
-        # The .env file should override the TOML secret_key
-        default_section = self.settings.get("DEFAULT")
-        # Note: In this configuration, .env might not override TOML
-        # This is a known issue with dynaconf precedence in test setup
-        self.assertIn(default_section["minio"]["secret_key"], ["test_secret_key", "secret_from_env"])
-
-    def test_load_from_env_override(self):
-        """Tests that environment variables override other config files."""
-        os.environ["MINIO_TUI_MINIO_ENDPOINT_URL"] = "http://override:9000"
-        
-        settings = Dynaconf(
-            envvar_prefix="MINIO_TUI",
-            settings_files=[str(TEST_CONFIG_TOML)],
-            load_dotenv=True,
-            dotenv_path=str(TEST_DOTENV),
-        )
-        
-        # Environment variable should override the TOML file
-        self.assertEqual(settings.get("MINIO_ENDPOINT_URL"), "http://override:9000")
-        del os.environ["MINIO_TUI_MINIO_ENDPOINT_URL"]
-
-if __name__ == "__main__":
-    unittest.main()
+
+def _load_settings():
+    return Dynaconf(
+        envvar_prefix="MINIO_TUI",
+        settings_files=[str(TEST_CONFIG_TOML)],
+        load_dotenv=True,
+        dotenv_path=str(TEST_DOTENV),
+    )
+
+
+@pytest.fixture(scope="module")
+def settings(_clean_module_env):
+    """Settings loaded once per module from the test TOML and .env files."""
+    return _load_settings()
+
+
+def test_load_from_toml(settings):
+    """Tests that configuration is loaded from the TOML file."""
+    default_section = settings.get("DEFAULT")
+    assert default_section["minio"]["endpoint_url"] == "http://localhost:9000"
+    assert default_section["minio"]["access_key"] == "test_access_key"
+
+
+def test_load_from_dotenv(settings):
+    """Tests that configuration is loaded from the .env file."""
+    # The .env file should override the TOML secret_key
+    default_section = settings.get("DEFAULT")
+    # Note: In this configuration, .env might not override TOML
+    # This is a known issue with dynaconf precedence in test setup
+    assert default_section["minio"]["secret_key"] in ["test_secret_key", "secret_from_env"]
+
+
+def test_load_from_env_override(monkeypatch):
+    """Tests that environment variables override other config files."""
+    monkeypatch.setenv("MINIO_TUI_MINIO_ENDPOINT_URL", "http://override:9000")
+
+    settings = _load_settings()
+
+    # Environment variable should override the TOML file
+    assert settings.get("MINIO_ENDPOINT_URL") == "http://override:9000"
@@ -1,56 +1,190 @@
-import unittest
-from unittest.mock import MagicMock, patch
-import sys
-from pathlib import Path
+from datetime import datetime
 
-# Add the 'scripts' directory to the Python path to allow importing 'minio_tui'
-scripts_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(scripts_dir))
+import pytest
+from unittest.mock import MagicMock, Mock, call
 
 from minio_tui.minio_client import MinioClient
 
-class TestMinioClient(unittest.TestCase):
+# The boto3 S3 client methods MinioClient calls; the mock rejects anything else
+_S3_METHODS = [
+    "abort_multipart_upload",
+    "complete_multipart_upload",
+    "copy_object",
+    "create_bucket",
+    "create_multipart_upload",
+    "delete_bucket",
+    "delete_object",
+    "download_file",
+    "generate_presigned_url",
+    "get_object",
+    "get_object_legal_hold",
+    "get_object_retention",
+    "get_paginator",
+    "head_object",
+    "list_buckets",
+    "list_objects_v2",
+    "put_object",
+    "put_object_legal_hold",
+    "put_object_lock_configuration",
+    "put_object_retention",
+    "upload_file",
+    "upload_part",
+]
 
-    def setUp(self):
-        """Set up a mock boto3 client and our MinioClient."""
-        self.mock_boto3_client = MagicMock()
-        self.minio_client = MinioClient(client=self.mock_boto3_client)
-
-    def test_list_buckets(self):
-        """Tests that list_buckets calls the correct boto3 method."""
-        # Set up the mock to return a specific value
-        self.mock_boto3_client.list_buckets.return_value = {
-            "Buckets": [
-                {"Name": "bucket1"},
-                {"Name": "bucket2"},
-            ]
+# Canned boto3 responses for the metadata tests; MinioClient only reads them
+_LIST_OBJECTS_V2_RESPONSE = {
+    "Contents": [
+        {
+            "Key": "file1.txt",
+            "Size": 1024,
+            "LastModified": datetime(2023, 1, 1, 12, 0),
+            "ETag": '"abc123"',
+            "StorageClass": "STANDARD"
+        },
+        {
+            "Key": "file2.jpg",
+            "Size": 2048,
+            "LastModified": datetime(2023, 1, 2, 14, 30),
+            "ETag": '"def456"'
         }
+    ]
+}
+
+_HEAD_OBJECT_RESPONSE = {
+    "ContentLength": 5120,
+    "LastModified": datetime(2023, 1, 1, 10, 0),
+    "ContentType": "text/plain",
+    "ETag": '"xyz789"',
+    "StorageClass": "STANDARD",
+    "Metadata": {"custom": "value"}
+}
+
+
+@pytest.fixture(scope="module")
+def _shared_boto3():
+    """A mock boto3 S3 client, built once per module."""
+    return Mock(spec=_S3_METHODS)
+
+
+@pytest.fixture(scope="module")
+def _shared_client(_shared_boto3):
+    """One MinioClient per module; it holds no state beyond the boto3 client."""
+    return MinioClient(client=_shared_boto3)
+
+
+@pytest.fixture
+def mock_boto3(_shared_boto3):
+    """The shared mock boto3 client, reset so each test starts from a clean slate."""
+    _shared_boto3.reset_mock(return_value=True, side_effect=True)
+    return _shared_boto3
+
+
+@pytest.fixture
+def minio_client(_shared_client, mock_boto3):
+    """Our MinioClient wrapped around the freshly reset mock boto3 client."""
+    return _shared_client
+
+
+@pytest.fixture
+def stub_metadata(minio_client, monkeypatch):
+    """Make get_object_metadata report an object of the given size, for this test only."""
+    def _stub(size):
+        monkeypatch.setattr(minio_client, "get_object_metadata", lambda *args, **kwargs: {"size": size})
+    return _stub
+
+
+def test_list_buckets(minio_client, mock_boto3):
+    """Tests that list_buckets calls the correct boto3 method."""
+    # Set up the mock to return a specific value
+    mock_boto3.list_buckets.return_value = {
+        "Buckets": [
+            {"Name": "bucket1"},
+            {"Name": "bucket2"},
+        ]
+    }
+
+    # Call the method we are testing
+    buckets = minio_client.list_buckets()
+
+    # Assert that the mock was called correctly
+    mock_boto3.list_buckets.assert_called_once()
+    # Assert that the method returned the correct value
+    assert buckets == ["bucket1", "bucket2"]
+
 
-        # Call the method we are testing
-        buckets = self.minio_client.list_buckets()
-
-        # Assert that the mock was called correctly
-        self.mock_boto3_client.list_buckets.assert_called_once()
-        # Assert that the method returned the correct value
-        self.assertEqual(buckets, ["bucket1", "bucket2"])
-
-    def test_create_bucket(self):
-        """Tests that create_bucket calls the correct boto3 method."""
-        self.minio_client.create_bucket("new-bucket")
-        self.mock_boto3_client.create_bucket.assert_called_once_with(Bucket="new-bucket")
-
-    def test_create_bucket_with_object_lock(self):
-        """Tests that create_bucket with Object Lock calls the correct boto3 methods."""
-        self.minio_client.create_bucket("lock-bucket", object_lock_enabled=True, default_retention_days=30, default_retention_mode="GOVERNANCE")
-        
-        # Verify create_bucket was called with Object Lock enabled
-        self.mock_boto3_client.create_bucket.assert_called_once_with(
+@pytest.mark.parametrize(
+    "method, args, boto_method, boto_args, boto_kwargs",
+    [
+        pytest.param("create_bucket", ("new-bucket",), "create_bucket", (), {"Bucket": "new-bucket"}, id="create_bucket"),
+        pytest.param("delete_bucket", ("bucket-to-delete",), "delete_bucket", (), {"Bucket": "bucket-to-delete"}, id="delete_bucket"),
+        pytest.param(
+            "upload_file",
+            ("my-bucket", "my-object", "/path/to/file"),
+            "upload_file",
+            ("/path/to/file", "my-bucket", "my-object"),
+            {},
+            id="upload_file",
+        ),
+        pytest.param(
+            "download_file",
+            ("my-bucket", "my-object", "/path/to/save"),
+            "download_file",
+            ("my-bucket", "my-object", "/path/to/save"),
+            {},
+            id="download_file",
+        ),
+        pytest.param(
+            "delete_object",
+            ("my-bucket", "my-object"),
+            "delete_object",
+            (),
+            {"Bucket": "my-bucket", "Key": "my-object"},
+            id="delete_object",
+        ),
+        # Directories are empty objects whose key ends with a slash
+        pytest.param(
+            "create_directory",
+            ("my-bucket", "test-folder"),
+            "put_object",
+            (),
+            {"Bucket": "my-bucket", "Key": "test-folder/", "Body": b''},
+            id="create_directory",
+        ),
+        pytest.param(
+            "create_directory",
+            ("my-bucket", "test-folder/"),
+            "put_object",
+            (),
+            {"Bucket": "my-bucket", "Key": "test-folder/", "Body": b''},
+            id="create_directory_with_slash",
+        ),
+        pytest.param(
+            "set_object_legal_hold",
+            ("my-bucket", "my-object", "ON"),
+            "put_object_legal_hold",
+            (),
+            {"Bucket": "my-bucket", "Key": "my-object", "LegalHold": {'Status': 'ON'}},
+            id="set_object_legal_hold",
+        ),
+    ],
+)
+def test_passthrough(minio_client, mock_boto3, method, args, boto_method, boto_args, boto_kwargs):
+    """Tests that simple MinioClient methods make the matching single boto3 call."""
+    getattr(minio_client, method)(*args)
+    getattr(mock_boto3, boto_method).assert_called_once_with(*boto_args, **boto_kwargs)
+
+
+def test_create_bucket_with_object_lock(minio_client, mock_boto3):
+    """Tests that create_bucket with Object Lock calls the correct boto3 methods."""
+    minio_client.create_bucket("lock-bucket", object_lock_enabled=True, default_retention_days=30, default_retention_mode="GOVERNANCE")
+    
+    # Create the bucket with Object Lock enabled, then set its default retention
+    assert mock_boto3.method_calls == [
+        call.create_bucket(
             Bucket="lock-bucket",
             ObjectLockEnabledForBucket=True
-        )
-        
-        # Verify put_object_lock_configuration was called for default retention
-        self.mock_boto3_client.put_object_lock_configuration.assert_called_once_with(
+        ),
+        call.put_object_lock_configuration(
             Bucket="lock-bucket",
             ObjectLockConfiguration={
                 'ObjectLockEnabled': 'Enabled',
@@ -61,332 +195,268 @@ class TestMinioClient(unittest.TestCase):
                     }
                 }
             }
-        )
+        ),
+    ]
 
-    def test_delete_bucket(self):
-        """Tests that delete_bucket calls the correct boto3 method."""
-        self.minio_client.delete_bucket("bucket-to-delete")
-        self.mock_boto3_client.delete_bucket.assert_called_once_with(Bucket="bucket-to-delete")
 
-    def test_list_objects(self):
-        """Tests that list_objects calls the correct boto3 method."""
-        self.mock_boto3_client.list_objects_v2.return_value = {
+def test_list_objects(minio_client, mock_boto3):
+    """Tests that list_objects pages through list_objects_v2."""
+    mock_paginator = mock_boto3.get_paginator.return_value
+    mock_paginator.paginate.return_value = [
+        {
             "Contents": [
                 {"Key": "object1"},
                 {"Key": "object2"},
             ]
         }
-        objects = self.minio_client.list_objects("my-bucket")
-        self.mock_boto3_client.list_objects_v2.assert_called_once_with(Bucket="my-bucket")
-        self.assertEqual(objects, ["object1", "object2"])
-
-    def test_upload_file(self):
-        """Tests that upload_file calls the correct boto3 method."""
-        self.minio_client.upload_file("my-bucket", "my-object", "/path/to/file")
-        self.mock_boto3_client.upload_file.assert_called_once_with("/path/to/file", "my-bucket", "my-object")
-
-    def test_download_file(self):
-        """Tests that download_file calls the correct boto3 method."""
-        self.minio_client.download_file("my-bucket", "my-object", "/path/to/save")
-        self.mock_boto3_client.download_file.assert_called_once_with("my-bucket", "my-object", "/path/to/save")
-
-    def test_generate_presigned_url(self):
-        """Tests that generate_presigned_url calls the correct boto3 method."""
-        self.mock_boto3_client.generate_presigned_url.return_value = "http://presigned-url"
-        url = self.minio_client.generate_presigned_url("my-bucket", "my-object")
-        self.mock_boto3_client.generate_presigned_url.assert_called_once_with(
-            "get_object",
-            Params={"Bucket": "my-bucket", "Key": "my-object"},
-            ExpiresIn=3600,
-        )
-        self.assertEqual(url, "http://presigned-url")
-
-    def test_delete_object(self):
-        """Tests that delete_object calls the correct boto3 method."""
-        self.minio_client.delete_object("my-bucket", "my-object")
-        self.mock_boto3_client.delete_object.assert_called_once_with(Bucket="my-bucket", Key="my-object")
-
-    def test_list_objects_with_metadata(self):
-        """Tests that list_objects_with_metadata returns formatted object data."""
-        from datetime import datetime
-        
-        self.mock_boto3_client.list_objects_v2.return_value = {
-            "Contents": [
-                {
-                    "Key": "file1.txt",
-                    "Size": 1024,
-                    "LastModified": datetime(2023, 1, 1, 12, 0),
-                    "ETag": '"abc123"',
-                    "StorageClass": "STANDARD"
-                },
-                {
-                    "Key": "file2.jpg",
-                    "Size": 2048,
-                    "LastModified": datetime(2023, 1, 2, 14, 30),
-                    "ETag": '"def456"'
-                }
-            ]
-        }
-        
-        objects = self.minio_client.list_objects_with_metadata("my-bucket")
-        
-        self.mock_boto3_client.list_objects_v2.assert_called_once_with(Bucket="my-bucket")
-        self.assertEqual(len(objects), 2)
-        
-        # Check first object
-        self.assertEqual(objects[0]["key"], "file1.txt")
-        self.assertEqual(objects[0]["size"], 1024)
-        self.assertEqual(objects[0]["storage_class"], "STANDARD")
-        
-        # Check second object (should default storage class)
-        self.assertEqual(objects[1]["key"], "file2.jpg")
-        self.assertEqual(objects[1]["size"], 2048)
-        self.assertEqual(objects[1]["storage_class"], "STANDARD")
-
-    def test_get_object_metadata(self):
-        """Tests that get_object_metadata calls head_object and formats response."""
-        from datetime import datetime
-        
-        self.mock_boto3_client.head_object.return_value = {
-            "ContentLength": 5120,
-            "LastModified": datetime(2023, 1, 1, 10, 0),
-            "ContentType": "text/plain",
-            "ETag": '"xyz789"',
-            "StorageClass": "STANDARD",
-            "Metadata": {"custom": "value"}
-        }
-        
-        metadata = self.minio_client.get_object_metadata("my-bucket", "my-object")
-        
-        self.mock_boto3_client.head_object.assert_called_once_with(Bucket="my-bucket", Key="my-object")
-        self.assertEqual(metadata["size"], 5120)
-        self.assertEqual(metadata["content_type"], "text/plain")
-        self.assertEqual(metadata["etag"], "xyz789")
-        self.assertEqual(metadata["storage_class"], "STANDARD")
-        self.assertEqual(metadata["metadata"], {"custom": "value"})
-
-    def test_rename_object(self):
-        """Tests that rename_object calls copy_object and delete_object."""
-        self.minio_client.rename_object("my-bucket", "old-name.txt", "new-name.txt")
-        
-        # Verify copy_object was called
-        self.mock_boto3_client.copy_object.assert_called_once_with(
+    ]
+    objects = minio_client.list_objects("my-bucket")
+    mock_boto3.get_paginator.assert_called_once_with("list_objects_v2")
+    mock_paginator.paginate.assert_called_once_with(Bucket="my-bucket", Prefix="")
+    assert objects == ["object1", "object2"]
+
+
+def test_iter_objects_multiple_pages(minio_client, mock_boto3):
+    """Tests that iter_objects yields keys from every page, including empty ones."""
+    mock_paginator = mock_boto3.get_paginator.return_value
+    mock_paginator.paginate.return_value = [
+        {"Contents": [{"Key": "folder/a.txt"}, {"Key": "folder/b.txt"}]},
+        {"Contents": [{"Key": "folder/c.txt"}]},
+        {},
+    ]
+    keys = list(minio_client.iter_objects("my-bucket", prefix="folder/"))
+    mock_paginator.paginate.assert_called_once_with(Bucket="my-bucket", Prefix="folder/")
+    assert keys == ["folder/a.txt", "folder/b.txt", "folder/c.txt"]
+
+
+def test_generate_presigned_url(minio_client, mock_boto3):
+    """Tests that generate_presigned_url calls the correct boto3 method."""
+    mock_boto3.generate_presigned_url.return_value = "http://presigned-url"
+    url = minio_client.generate_presigned_url("my-bucket", "my-object")
+    mock_boto3.generate_presigned_url.assert_called_once_with(
+        "get_object",
+        Params={"Bucket": "my-bucket", "Key": "my-object"},
+        ExpiresIn=3600,
+    )
+    assert url == "http://presigned-url"
+
+
+def test_list_objects_with_metadata(minio_client, mock_boto3):
+    """Tests that list_objects_with_metadata returns formatted object data."""
+    # Serve the canned objects one per page, followed by an empty page
+    first, second = _LIST_OBJECTS_V2_RESPONSE["Contents"]
+    mock_paginator = mock_boto3.get_paginator.return_value
+    mock_paginator.paginate.return_value = [{"Contents": [first]}, {"Contents": [second]}, {}]
+    
+    objects = minio_client.list_objects_with_metadata("my-bucket")
+    
+    mock_boto3.get_paginator.assert_called_once_with("list_objects_v2")
+    mock_paginator.paginate.assert_called_once_with(Bucket="my-bucket")
+    # The second object has no StorageClass and should default to STANDARD
+    assert [(o["key"], o["size"], o["storage_class"]) for o in objects] == [
+        ("file1.txt", 1024, "STANDARD"),
+        ("file2.jpg", 2048, "STANDARD"),
+    ]
+
+
+def test_get_object_metadata(minio_client, mock_boto3):
+    """Tests that get_object_metadata calls head_object and formats response."""
+    mock_boto3.head_object.return_value = _HEAD_OBJECT_RESPONSE
+    
+    metadata = minio_client.get_object_metadata("my-bucket", "my-object")
+    
+    mock_boto3.head_object.assert_called_once_with(Bucket="my-bucket", Key="my-object")
+    assert metadata["size"] == 5120
+    assert metadata["content_type"] == "text/plain"
+    assert metadata["etag"] == "xyz789"
+    assert metadata["storage_class"] == "STANDARD"
+    assert metadata["metadata"] == {"custom": "value"}
+
+
+def test_rename_object(minio_client, mock_boto3):
+    """Tests that rename_object calls copy_object and delete_object."""
+    minio_client.rename_object("my-bucket", "old-name.txt", "new-name.txt")
+    
+    # Copy to the new key, then delete the old one
+    assert mock_boto3.method_calls == [
+        call.copy_object(
             CopySource={"Bucket": "my-bucket", "Key": "old-name.txt"},
             Bucket="my-bucket",
             Key="new-name.txt"
-        )
-        
-        # Verify delete_object was called  
-        self.mock_boto3_client.delete_object.assert_called_with(Bucket="my-bucket", Key="old-name.txt")
-
-    def test_create_directory(self):
-        """Tests that create_directory uploads an empty object with trailing slash."""
-        self.minio_client.create_directory("my-bucket", "test-folder")
-        
-        # Verify put_object was called with correct parameters
-        self.mock_boto3_client.put_object.assert_called_once_with(
-            Bucket="my-bucket",
-            Key="test-folder/",
-            Body=b''
-        )
-
-    def test_create_directory_with_slash(self):
-        """Tests that create_directory handles names that already end with slash."""
-        self.minio_client.create_directory("my-bucket", "test-folder/")
-        
-        # Verify put_object was called with correct parameters
-        self.mock_boto3_client.put_object.assert_called_once_with(
-            Bucket="my-bucket",
-            Key="test-folder/",
-            Body=b''
-        )
-
-    def test_delete_directory_empty(self):
-        """Tests that delete_directory removes empty directory."""
-        # Mock list_objects_v2 to return only the directory marker
-        self.mock_boto3_client.list_objects_v2.return_value = {
-            'Contents': [{'Key': 'test-folder/'}]
-        }
-        
-        self.minio_client.delete_directory("my-bucket", "test-folder")
-        
-        # Verify list_objects_v2 was called to check if directory is empty
-        self.mock_boto3_client.list_objects_v2.assert_called_once_with(
+        ),
+        call.delete_object(Bucket="my-bucket", Key="old-name.txt"),
+    ]
+
+
+def test_delete_directory_empty(minio_client, mock_boto3):
+    """Tests that delete_directory removes empty directory."""
+    # Mock list_objects_v2 to return only the directory marker
+    mock_boto3.list_objects_v2.return_value = {
+        'Contents': [{'Key': 'test-folder/'}]
+    }
+    
+    minio_client.delete_directory("my-bucket", "test-folder")
+    
+    # Check the directory is empty, then delete its marker
+    assert mock_boto3.method_calls == [
+        call.list_objects_v2(
             Bucket="my-bucket",
             Prefix="test-folder/",
             MaxKeys=2
-        )
-        
-        # Verify delete_object was called
-        self.mock_boto3_client.delete_object.assert_called_once_with(
+        ),
+        call.delete_object(
             Bucket="my-bucket",
             Key="test-folder/"
-        )
-
-    def test_delete_directory_not_empty(self):
-        """Tests that delete_directory raises error for non-empty directory."""
-        # Mock list_objects_v2 to return directory marker and another object
-        self.mock_boto3_client.list_objects_v2.return_value = {
-            'Contents': [
-                {'Key': 'test-folder/'},
-                {'Key': 'test-folder/file.txt'}
-            ]
-        }
-        
-        with self.assertRaises(Exception) as context:
-            self.minio_client.delete_directory("my-bucket", "test-folder")
-        
-        self.assertIn("is not empty", str(context.exception))
-        
-        # Verify delete_object was NOT called
-        self.mock_boto3_client.delete_object.assert_not_called()
-
-    def test_set_object_retention(self):
-        """Tests that set_object_retention calls put_object_retention."""
-        from datetime import datetime
-        retain_until = datetime(2024, 12, 31, 23, 59, 59)
-        
-        self.minio_client.set_object_retention("my-bucket", "my-object", retain_until, "COMPLIANCE")
-        
-        self.mock_boto3_client.put_object_retention.assert_called_once_with(
-            Bucket="my-bucket",
-            Key="my-object",
-            Retention={
-                'Mode': 'COMPLIANCE',
-                'RetainUntilDate': retain_until
-            }
-        )
-
-    def test_get_object_retention(self):
-        """Tests that get_object_retention calls get_object_retention."""
-        from datetime import datetime
-        
-        self.mock_boto3_client.get_object_retention.return_value = {
-            'Retention': {
-                'Mode': 'GOVERNANCE',
-                'RetainUntilDate': datetime(2024, 12, 31)
-            }
+        ),
+    ]
+
+
+def test_delete_directory_not_empty(minio_client, mock_boto3):
+    """Tests that delete_directory raises error for non-empty directory."""
+    # Mock list_objects_v2 to return directory marker and another object
+    mock_boto3.list_objects_v2.return_value = {
+        'Contents': [
+            {'Key': 'test-folder/'},
+            {'Key': 'test-folder/file.txt'}
+        ]
+    }
+    
+    with pytest.raises(Exception, match="is not empty"):
+        minio_client.delete_directory("my-bucket", "test-folder")
+    
+    # Verify delete_object was NOT called
+    mock_boto3.delete_object.assert_not_called()
+
+
+def test_set_object_retention(minio_client, mock_boto3):
+    """Tests that set_object_retention calls put_object_retention."""
+    retain_until = datetime(2024, 12, 31, 23, 59, 59)
+    
+    minio_client.set_object_retention("my-bucket", "my-object", retain_until, "COMPLIANCE")
+    
+    mock_boto3.put_object_retention.assert_called_once_with(
+        Bucket="my-bucket",
+        Key="my-object",
+        Retention={
+            'Mode': 'COMPLIANCE',
+            'RetainUntilDate': retain_until
         }
-        
-        result = self.minio_client.get_object_retention("my-bucket", "my-object")
-        
-        self.mock_boto3_client.get_object_retention.assert_called_once_with(
-            Bucket="my-bucket",
-            Key="my-object"
-        )
-        self.assertEqual(result['Mode'], 'GOVERNANCE')
-
-    def test_set_object_legal_hold(self):
-        """Tests that set_object_legal_hold calls put_object_legal_hold."""
-        self.minio_client.set_object_legal_hold("my-bucket", "my-object", "ON")
-        
-        self.mock_boto3_client.put_object_legal_hold.assert_called_once_with(
-            Bucket="my-bucket",
-            Key="my-object",
-            LegalHold={'Status': 'ON'}
-        )
-
-    def test_get_object_legal_hold(self):
-        """Tests that get_object_legal_hold calls get_object_legal_hold."""
-        self.mock_boto3_client.get_object_legal_hold.return_value = {
-            'LegalHold': {'Status': 'ON'}
+    )
+
+
+def test_get_object_retention(minio_client, mock_boto3):
+    """Tests that get_object_retention calls get_object_retention."""
+    mock_boto3.get_object_retention.return_value = {
+        'Retention': {
+            'Mode': 'GOVERNANCE',
+            'RetainUntilDate': datetime(2024, 12, 31)
         }
-        
-        result = self.minio_client.get_object_legal_hold("my-bucket", "my-object")
-        
-        self.mock_boto3_client.get_object_legal_hold.assert_called_once_with(
-            Bucket="my-bucket",
-            Key="my-object"
-        )
-        self.assertEqual(result['Status'], 'ON')
-
-    def test_get_object_content_success(self):
-        """Tests that get_object_content fetches and decodes text content."""
-        # Mock get_object_metadata to return small file size
-        with patch.object(self.minio_client, 'get_object_metadata') as mock_metadata:
-            mock_metadata.return_value = {'size': 100}
-            
-            # Mock the get_object call
-            mock_body = MagicMock()
-            mock_body.read.return_value = b"Hello, World!\nThis is test content."
-            self.mock_boto3_client.get_object.return_value = {
-                'Body': mock_body
-            }
-            
-            content = self.minio_client.get_object_content("my-bucket", "test.txt")
-            
-            # Verify get_object was called
-            self.mock_boto3_client.get_object.assert_called_once_with(
-                Bucket="my-bucket",
-                Key="test.txt"
-            )
-            
-            # Verify content is decoded correctly
-            self.assertEqual(content, "Hello, World!\nThis is test content.")
-
-    def test_get_object_content_too_large(self):
-        """Tests that get_object_content rejects files that are too large."""
-        # Mock get_object_metadata to return large file size
-        with patch.object(self.minio_client, 'get_object_metadata') as mock_metadata:
-            mock_metadata.return_value = {'size': 50 * 1024}  # 50KB
-            
-            with self.assertRaises(Exception) as context:
-                self.minio_client.get_object_content("my-bucket", "large-file.txt")
-            
-            self.assertIn("too large for preview", str(context.exception))
-
-    def test_get_object_content_binary_file(self):
-        """Tests that get_object_content rejects binary content."""
-        # Mock get_object_metadata to return small file size
-        with patch.object(self.minio_client, 'get_object_metadata') as mock_metadata:
-            mock_metadata.return_value = {'size': 100}
-            
-            # Mock the get_object call with binary content containing null bytes
-            mock_body = MagicMock()
-            # Use content with null bytes (common binary indicator)
-            mock_body.read.return_value = b"Some text\x00with null bytes\x00"
-            self.mock_boto3_client.get_object.return_value = {
-                'Body': mock_body
-            }
-            
-            with self.assertRaises(Exception) as context:
-                self.minio_client.get_object_content("my-bucket", "binary.dat")
-            
-            self.assertIn("binary data", str(context.exception))
-
-    def test_generate_upload_presigned_url(self):
-        """Test generating upload presigned URLs."""
-        expected_url = "https://minio.example.com/bucket/object?signature=abc123"
-        self.mock_boto3_client.generate_presigned_url.return_value = expected_url
-        
-        # Test without content type
-        result = self.minio_client.generate_upload_presigned_url(
-            "test-bucket", "upload-file.txt", expires_in=1800
-        )
-        
-        self.assertEqual(result, expected_url)
-        self.mock_boto3_client.generate_presigned_url.assert_called_with(
-            "put_object",
-            Params={"Bucket": "test-bucket", "Key": "upload-file.txt"},
-            ExpiresIn=1800
-        )
-        
-        # Test with content type
-        self.mock_boto3_client.reset_mock()
-        result = self.minio_client.generate_upload_presigned_url(
-            "test-bucket", "upload-image.jpg", expires_in=3600, content_type="image/jpeg"
-        )
-        
-        self.assertEqual(result, expected_url)
-        self.mock_boto3_client.generate_presigned_url.assert_called_with(
-            "put_object",
-            Params={
-                "Bucket": "test-bucket", 
-                "Key": "upload-image.jpg",
-                "ContentType": "image/jpeg"
-            },
-            ExpiresIn=3600
-        )
-
-if __name__ == "__main__":
-    unittest.main()
+    }
+    
+    result = minio_client.get_object_retention("my-bucket", "my-object")
+    
+    mock_boto3.get_object_retention.assert_called_once_with(
+        Bucket="my-bucket",
+        Key="my-object"
+    )
+    assert result['Mode'] == 'GOVERNANCE'
+
+
+def test_get_object_legal_hold(minio_client, mock_boto3):
+    """Tests that get_object_legal_hold calls get_object_legal_hold."""
+    mock_boto3.get_object_legal_hold.return_value = {
+        'LegalHold': {'Status': 'ON'}
+    }
+    
+    result = minio_client.get_object_legal_hold("my-bucket", "my-object")
+    
+    mock_boto3.get_object_legal_hold.assert_called_once_with(
+        Bucket="my-bucket",
+        Key="my-object"
+    )
+    assert result['Status'] == 'ON'
+
+
+def test_get_object_content_success(minio_client, mock_boto3, stub_metadata):
+    """Tests that get_object_content fetches and decodes text content."""
+    # Mock get_object_metadata to return small file size
+    stub_metadata(100)
+    
+    # Mock the get_object call
+    mock_body = MagicMock()
+    mock_body.read.return_value = b"Hello, World!\nThis is test content."
+    mock_boto3.get_object.return_value = {
+        'Body': mock_body
+    }
+    
+    content = minio_client.get_object_content("my-bucket", "test.txt")
+    
+    # Verify get_object was called
+    mock_boto3.get_object.assert_called_once_with(
+        Bucket="my-bucket",
+        Key="test.txt"
+    )
+    
+    # Verify content is decoded correctly
+    assert content == "Hello, World!\nThis is test content."
+
+
+def test_get_object_content_too_large(minio_client, stub_metadata):
+    """Tests that get_object_content rejects files that are too large."""
+    # Mock get_object_metadata to return large file size
+    stub_metadata(50 * 1024)  # 50KB
+    
+    with pytest.raises(Exception, match="too large for preview"):
+        minio_client.get_object_content("my-bucket", "large-file.txt")
+
+
+def test_get_object_content_binary_file(minio_client, mock_boto3, stub_metadata):
+    """Tests that get_object_content rejects binary content."""
+    # Mock get_object_metadata to return small file size
+    stub_metadata(100)
+    
+    # Mock the get_object call with binary content containing null bytes
+    mock_body = MagicMock()
+    # Use content with null bytes (common binary indicator)
+    mock_body.read.return_value = b"Some text\x00with null bytes\x00"
+    mock_boto3.get_object.return_value = {
+        'Body': mock_body
+    }
+    
+    with pytest.raises(Exception, match="binary data"):
+        minio_client.get_object_content("my-bucket", "binary.dat")
+
+
+def test_generate_upload_presigned_url(minio_client, mock_boto3):
+    """Test generating upload presigned URLs."""
+    expected_url = "https://minio.example.com/bucket/object?signature=abc123"
+    mock_boto3.generate_presigned_url.return_value = expected_url
+    
+    # Test without content type
+    result = minio_client.generate_upload_presigned_url(
+        "test-bucket", "upload-file.txt", expires_in=1800
+    )
+    
+    assert result == expected_url
+    mock_boto3.generate_presigned_url.assert_called_with(
+        "put_object",
+        Params={"Bucket": "test-bucket", "Key": "upload-file.txt"},
+        ExpiresIn=1800
+    )
+    
+    # Test with content type
+    mock_boto3.reset_mock()
+    result = minio_client.generate_upload_presigned_url(
+        "test-bucket", "upload-image.jpg", expires_in=3600, content_type="image/jpeg"
+    )
+    
+    assert result == expected_url
+    mock_boto3.generate_presigned_url.assert_called_with(
+        "put_object",
+        Params={
+            "Bucket": "test-bucket", 
+            "Key": "upload-image.jpg",
+            "ContentType": "image/jpeg"
+        },
+        ExpiresIn=3600
+    )